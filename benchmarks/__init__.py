@@ -0,0 +1,14 @@
+"""
+Benchmarks for the v3_a2l hot paths.
+
+- synth: generators for synthetic A2L files and C sources (compiled into DWARF ELFs).
+- fixtures/: small hand-written C fixtures (nested structs, arrays, unions).
+- run: times parse/update/merge/symbol phases at several sizes and stores or compares JSON baselines.
+- startup: times each subcommand from a fresh interpreter against a budget and checks that commands
+  without an ELF do not import pyelftools.
+
+Run from the repository root:
+    python -m benchmarks.run --sizes 1000 10000 --save benchmarks/baseline.json
+    python -m benchmarks.run --sizes 1000 10000 --compare benchmarks/baseline.json
+    python -m benchmarks.startup
+"""
@@ -0,0 +1,20 @@
+/* Hand-written DWARF fixture: typedefs, nested structs, arrays of structs, unions and enums. */
+#include <stdint.h>
+
+typedef struct { uint8_t a; uint16_t b; float c[3]; } Inner;
+typedef struct { Inner items[4]; int32_t count; union { uint32_t u; float f; } uv; } Outer;
+typedef struct { Outer StandardFaultDataSet; uint8_t flags[40]; } Slot;
+typedef uint16_t Counter_t;
+
+Slot ErrStoreMgr[2];
+volatile uint32_t gCounter = 5;
+double gGain = 1.5;
+int16_t gTable[8];
+Inner gInner;
+Counter_t gTicks;
+int64_t gBig;
+enum Mode { MODE_A, MODE_B } gMode;
+static uint8_t sLocal;
+
+uint8_t *touch(void) { sLocal++; return &sLocal; }
+int main(void) { return (int)gCounter + touch()[0]; }
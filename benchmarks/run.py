@@ -0,0 +1,162 @@
+"""
+Time the v3_a2l hot paths on synthetic inputs and store/compare JSON baselines.
+
+Phases per size (best of --repeat runs, seconds):
+  read_a2l_lines, parse_a2l_blocks, build_symbols_dict, update_a2l_lines, save, mergea2l, Updatea2l,
+  plus build_symbols_dict on the hand-written fixtures. ELF phases are skipped when no C compiler is found.
+
+Usage:
+  python -m benchmarks.run [--sizes 1000 10000] [--repeat 3] [--canape 0.5] [--ext-limits 0.3]
+                           [--recurring 0.05] [--save <json>] [--compare <json>] [--tolerance 0.25]
+"""
+
+import argparse
+import contextlib
+import importlib.machinery
+import importlib.util
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from . import synth
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Differences below this many seconds are treated as noise when comparing
+NOISE_FLOOR = 0.005
+
+def load_tool(path: Optional[str] = None):
+    """Import the extensionless v3_a2l script as module 'v3_a2l' (registered so worker processes can unpickle)."""
+    path = path or os.path.join(REPO_DIR, "v3_a2l")
+    loader = importlib.machinery.SourceFileLoader("v3_a2l", path)
+    spec = importlib.util.spec_from_loader("v3_a2l", loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["v3_a2l"] = module
+    loader.exec_module(module)
+    return module
+
+def best_of(repeat: int, fn: Callable[[], Any]) -> float:
+    """Best wall time of fn over repeat runs; its stdout is discarded."""
+    best = float("inf")
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            t0 = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - t0)
+    return best
+
+def bench_size(tool, n: int, workdir: str, repeat: int, params: Dict[str, float], compiler: Optional[str]) -> Dict[str, Optional[float]]:
+    n_vars = max(30, n // 8)
+    symbols = synth.synthetic_symbols(n_vars)
+    a2l = synth.write_a2l(os.path.join(workdir, f"bench_{n}.a2l"), n, symbols, **params)
+    extra = [synth.write_a2l(os.path.join(workdir, f"bench_{n}_{k}.a2l"), max(1, n // 4), symbols, seed=k, start=n - n // 8, **params)
+             for k in (1, 2)]
+    elf = synth.compile_elf(synth.generate_c(n_vars), os.path.join(workdir, f"bench_{n}.elf"), compiler) if compiler else None
+    out = os.path.join(workdir, f"out_{n}.a2l")
+
+    res: Dict[str, Optional[float]] = {}
+    res["read_a2l_lines"] = best_of(repeat, lambda: list(tool.read_a2l_lines(a2l)))
+    lines = list(tool.read_a2l_lines(a2l))
+    res["parse_a2l_blocks"] = best_of(repeat, lambda: tool.parse_a2l_blocks(lines))
+    filters = tool.A2LBlockIndex(lines).filters()
+
+    if elf is None:
+        for phase in ("build_symbols_dict", "update_a2l_lines", "save", "mergea2l", "Updatea2l"):
+            res[phase] = None
+        return res
+
+    res["build_symbols_dict"] = best_of(repeat, lambda: tool.build_symbols_dict(elf, filters))
+    with contextlib.redirect_stdout(io.StringIO()):
+        symbols_dict, _ = tool.build_symbols_dict(elf, filters)
+    addr_map = {name: tool.to_upper_hex(meta["address"]) for name, meta in symbols_dict.items()}
+
+    def update():
+        index = tool.A2LBlockIndex(list(lines))
+        tool.update_a2l_lines(index.lines, index.blocks, addr_map, index.uses_extended_limits(), log=tool.ChangeLog(), index=index)
+        return index
+    res["update_a2l_lines"] = best_of(repeat, update)
+    updated = update()
+    res["save"] = best_of(repeat, lambda: tool._save_a2l(updated, out))
+    res["mergea2l"] = best_of(repeat, lambda: tool.mergea2l([a2l] + extra, out, elf=elf))
+    res["Updatea2l"] = best_of(repeat, lambda: tool.Updatea2l(a2l, elf, out))
+    return res
+
+def bench_fixtures(tool, workdir: str, repeat: int, compiler: Optional[str]) -> Dict[str, Optional[float]]:
+    res: Dict[str, Optional[float]] = {}
+    for src in synth.fixture_sources():
+        stem = os.path.splitext(os.path.basename(src))[0]
+        elf = synth.compile_elf(src, os.path.join(workdir, stem + ".elf"), compiler) if compiler else None
+        res[f"build_symbols_dict[{stem}]"] = best_of(repeat, lambda: tool.build_symbols_dict(elf, None)) if elf else None
+    return res
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Phases slower than baseline by more than tolerance (and the noise floor)."""
+    regressions: List[str] = []
+    for size, phases in current["results"].items():
+        base_phases = baseline.get("results", {}).get(size, {})
+        for phase, t in phases.items():
+            b = base_phases.get(phase)
+            if t is None or b is None:
+                continue
+            ratio = t / b if b > 0 else float("inf")
+            mark = ""
+            if t > b * (1.0 + tolerance) and t - b > NOISE_FLOOR:
+                mark = "  REGRESSION"
+                regressions.append(f"{size}/{phase}")
+            print(f"{size:>10} {phase:<36} {b:10.4f}s -> {t:10.4f}s  x{ratio:5.2f}{mark}")
+    return regressions
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark v3_a2l hot paths on synthetic inputs.")
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000], help="A2L object counts")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--canape", type=float, default=0.5, help="share of blocks with IF_DATA CANAPE_EXT")
+    ap.add_argument("--ext-limits", type=float, default=0.3, help="share of CHARACTERISTICs with EXTENDED_LIMITS")
+    ap.add_argument("--recurring", type=float, default=0.05, help="share of blocks reusing an earlier symbol")
+    ap.add_argument("--tool", help="path of the v3_a2l script (default: the one in this repository)")
+    ap.add_argument("--save", help="write results as a JSON baseline")
+    ap.add_argument("--compare", help="compare against a JSON baseline; exit 1 on regressions")
+    ap.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown ratio before flagging")
+    args = ap.parse_args(argv)
+
+    tool = load_tool(args.tool)
+    compiler = synth.find_compiler()
+    if not compiler:
+        print("No C compiler found (set CC); ELF phases are skipped.")
+    params = {"canape_density": args.canape, "ext_limits": args.ext_limits, "recurring": args.recurring}
+
+    results: Dict[str, Dict[str, Optional[float]]] = {}
+    with tempfile.TemporaryDirectory(prefix="a2l_bench_") as workdir:
+        results["fixtures"] = bench_fixtures(tool, workdir, args.repeat, compiler)
+        for n in args.sizes:
+            results[str(n)] = bench_size(tool, n, workdir, args.repeat, params, compiler)
+            for phase, t in results[str(n)].items():
+                print(f"{n:>10} {phase:<36} " + ("skipped" if t is None else f"{t:10.4f}s"))
+
+    current = {
+        "meta": {"tool_version": tool.A2L_TOOL_VERSION, "python": platform.python_version(),
+                 "machine": platform.machine(), "system": platform.system(), "params": params, "repeat": args.repeat,
+                 "date": time.strftime("%Y-%m-%dT%H:%M:%S")},
+        "results": results,
+    }
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+        print(f"Baseline written to: {args.save}")
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"\nComparison against {args.compare} (tolerance {args.tolerance:.0%}):")
+        regressions = compare(current, baseline, args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} regression(s): " + ", ".join(regressions))
+            return 1
+        print("No regressions.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
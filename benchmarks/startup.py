@@ -0,0 +1,107 @@
+"""
+Measure v3_a2l startup per subcommand and check it against a budget.
+
+Each command runs in a fresh interpreter (best of --repeat runs); its wall time minus a bare `python -c pass`
+is compared with the command's budget. Commands that never open an ELF must also not import pyelftools
+(checked with -X importtime).
+
+Usage:
+  python -m benchmarks.startup [--repeat 5] [--scale 1.0] [--tool <path>]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+from . import synth
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Modules that only ELF-reading commands may import
+ELF_ONLY_MODULES = ("elftools",)
+# Seconds over bare interpreter startup allowed per command (multiplied by --scale). The extensionless
+# script is compiled on every run (no .pyc), which accounts for most of the usage figure.
+BUDGETS: Dict[str, float] = {
+    "usage": 0.10,
+    "check": 0.12,
+    "query": 0.12,
+    "merge": 0.15,
+    "update": 0.40,
+}
+
+def _run(argv: List[str]) -> Tuple[float, str]:
+    t0 = time.perf_counter()
+    proc = subprocess.run(argv, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    return time.perf_counter() - t0, proc.stderr
+
+def best_of(repeat: int, argv: List[str]) -> float:
+    return min(_run(argv)[0] for _ in range(repeat))
+
+def imported_modules(argv: List[str]) -> List[str]:
+    """Top-level names of the modules imported while running argv (from -X importtime)."""
+    _, err = _run([argv[0], "-X", "importtime"] + argv[1:])
+    names = []
+    for line in err.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            names.append(line.rsplit("|", 1)[1].strip())
+    return names
+
+def commands(tool: str, workdir: str, compiler: Optional[str]) -> Dict[str, Tuple[List[str], bool]]:
+    """name -> (argv, needs_elf) for each measured subcommand."""
+    symbols = synth.synthetic_symbols(30)
+    a2l = synth.write_a2l(os.path.join(workdir, "startup.a2l"), 200, symbols)
+    other = synth.write_a2l(os.path.join(workdir, "startup_2.a2l"), 50, symbols, seed=1, start=180)
+    out = os.path.join(workdir, "out.a2l")
+    py = [sys.executable, tool]
+    cmds: Dict[str, Tuple[List[str], bool]] = {
+        "usage": (py, False),
+        "check": (py + ["check", a2l, "--overlaps"], False),
+        "query": (py + ["query", a2l, "--range", "0x70000000", "0x70000100"], False),
+        "merge": (py + ["merge", out, a2l, other, "--dry-run"], False),
+    }
+    elf = synth.compile_elf(synth.generate_c(30), os.path.join(workdir, "startup.elf"), compiler) if compiler else None
+    if elf:
+        cmds["update"] = (py + ["update", a2l, elf, out, "--dry-run"], True)
+    return cmds
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Check v3_a2l startup time per subcommand.")
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--scale", type=float, default=1.0, help="multiply every budget (slow machines)")
+    ap.add_argument("--tool", help="path of the v3_a2l script (default: the one in this repository)")
+    args = ap.parse_args(argv)
+
+    tool = args.tool or os.path.join(REPO_DIR, "v3_a2l")
+    compiler = synth.find_compiler()
+    if not compiler:
+        print("No C compiler found (set CC); update is skipped.")
+    bare = best_of(args.repeat, [sys.executable, "-c", "pass"])
+    print(f"{'python -c pass':<10} {bare:8.4f}s")
+
+    violations: List[str] = []
+    with tempfile.TemporaryDirectory(prefix="a2l_startup_") as workdir:
+        for name, (cmd, needs_elf) in commands(tool, workdir, compiler).items():
+            extra = best_of(args.repeat, cmd) - bare
+            budget = BUDGETS[name] * args.scale
+            mark = ""
+            if extra > budget:
+                mark = "  OVER BUDGET"
+                violations.append(f"{name}: {extra:.4f}s > {budget:.4f}s")
+            if not needs_elf:
+                leaked = sorted({m for m in imported_modules(cmd) for p in ELF_ONLY_MODULES if m == p or m.startswith(p + ".")})
+                if leaked:
+                    mark += "  IMPORTS " + ",".join(leaked[:3])
+                    violations.append(f"{name}: imports {leaked[0]}" + (f" (+{len(leaked) - 1} more)" if len(leaked) > 1 else ""))
+            print(f"{name:<10} +{extra:7.4f}s  (budget {budget:.3f}s){mark}")
+
+    if violations:
+        print(f"{len(violations)} violation(s): " + "; ".join(violations))
+        return 1
+    print("All commands within budget.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""
+Synthetic inputs for the benchmarks: C sources with nested structs/arrays (compiled with the host C compiler
+into DWARF ELFs) and A2L files whose SYMBOL_LINKs refer to the flattened names of those sources.
+"""
+
+import os
+import random
+import shutil
+import subprocess
+from typing import List, Optional
+
+A2L_TYPES = ["UBYTE", "SBYTE", "UWORD", "SWORD", "ULONG", "SLONG", "FLOAT32_IEEE", "FLOAT64_IEEE"]
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+C_PRELUDE = """#include <stdint.h>
+typedef struct { uint8_t a; uint16_t b; float c[4]; } Leaf;
+typedef struct { Leaf leaf[2]; int32_t count; union { uint32_t u; float f; } uv; } Node;
+"""
+
+# ----------------------------
+# C / ELF
+# ----------------------------
+
+def generate_c(n_vars: int) -> str:
+    """C source with n_vars globals, cycling through a nested struct, a scalar and an array."""
+    out = [C_PRELUDE]
+    for i in range(n_vars):
+        k = i % 3
+        if k == 0:
+            out.append(f"Node node{i};\n")
+        elif k == 1:
+            out.append(f"uint32_t scalar{i} = {i + 1};\n")
+        else:
+            out.append(f"int16_t table{i}[8];\n")
+    out.append("int main(void) { return 0; }\n")
+    return "".join(out)
+
+def synthetic_symbols(n_vars: int) -> List[str]:
+    """Flattened names (as v3_a2l emits them) of leaf objects declared by generate_c(n_vars)."""
+    names: List[str] = []
+    for i in range(n_vars):
+        k = i % 3
+        if k == 0:
+            for j in range(2):
+                names.append(f"node{i}.leaf._{j}_.a")
+                names.append(f"node{i}.leaf._{j}_.b")
+                names.extend(f"node{i}.leaf._{j}_.c._{e}_" for e in range(4))
+            names.append(f"node{i}.count")
+            names.append(f"node{i}.uv.u")
+        elif k == 1:
+            names.append(f"scalar{i}")
+        else:
+            names.extend(f"table{i}._{e}_" for e in range(8))
+    return names
+
+def find_compiler() -> Optional[str]:
+    return shutil.which(os.environ.get("CC", "cc")) or shutil.which("gcc") or shutil.which("clang")
+
+def compile_elf(source: str, out_path: str, compiler: Optional[str] = None) -> Optional[str]:
+    """Compile C source (text or a .c path) with -g -O0 into out_path; None if no compiler is available."""
+    compiler = compiler or find_compiler()
+    if not compiler:
+        return None
+    src_path = source
+    if not source.endswith(".c") or "\n" in source:
+        src_path = os.path.splitext(out_path)[0] + ".c"
+        with open(src_path, "w", encoding="utf-8") as f:
+            f.write(source)
+    subprocess.run([compiler, "-g", "-O0", "-o", out_path, src_path], check=True)
+    return out_path
+
+def fixture_sources() -> List[str]:
+    """Paths of the hand-written C fixtures."""
+    return sorted(os.path.join(FIXTURES_DIR, n) for n in os.listdir(FIXTURES_DIR) if n.endswith(".c"))
+
+# ----------------------------
+# A2L
+# ----------------------------
+
+def _a2l_block(kind: str, name: str, symbol: str, a2l_type: str, addr: int, canape: bool, ext_limits: bool) -> List[str]:
+    if kind == "MEASUREMENT":
+        lines = [f"    /begin MEASUREMENT {name} \"\"\n",
+                 f"      {a2l_type} NO_COMPU_METHOD 0 0 0 255\n",
+                 f"      ECU_ADDRESS 0x{addr:X}\n",
+                 "      ECU_ADDRESS_EXTENSION 0x0\n"]
+    else:
+        lines = [f"    /begin CHARACTERISTIC {name} \"\"\n",
+                 f"      VALUE 0x{addr:X} RL_{a2l_type} 0 NO_COMPU_METHOD 0 255\n"]
+        if ext_limits:
+            lines.append("      EXTENDED_LIMITS 0 255\n")
+    if canape:
+        lines += ["      /begin IF_DATA CANAPE_EXT\n",
+                  "        100\n",
+                  f"        LINK_MAP \"{symbol}\" 0x{addr:X} 0x0 0 0x0 1 0x0 0x0\n",
+                  "        DISPLAY 0 0 255\n",
+                  "      /end IF_DATA\n"]
+    lines += [f"      SYMBOL_LINK \"{symbol}\" 0\n", f"    /end {kind}\n"]
+    return lines
+
+def generate_a2l(n_objects: int, symbols: List[str], canape_density: float = 0.5, ext_limits: float = 0.3,
+                 recurring: float = 0.05, characteristic_ratio: float = 0.3, seed: int = 0, start: int = 0) -> str:
+    """
+    A2L text with n_objects MEASUREMENT/CHARACTERISTIC blocks linked to symbols (cycled from start).
+    canape_density: share of blocks with IF_DATA CANAPE_EXT; ext_limits: share of CHARACTERISTICs with
+    EXTENDED_LIMITS; recurring: share of blocks reusing an earlier block's symbol at another address.
+    Deterministic for a given seed.
+    """
+    rng = random.Random(seed)
+    used: List[str] = []
+    out = ["ASAP2_VERSION 1 61\n", "/begin PROJECT P \"\"\n", "  /begin MODULE M \"\"\n"]
+    for i in range(n_objects):
+        if used and rng.random() < recurring:
+            symbol = rng.choice(used)
+        else:
+            symbol = symbols[(start + i) % len(symbols)]
+            used.append(symbol)
+        kind = "CHARACTERISTIC" if rng.random() < characteristic_ratio else "MEASUREMENT"
+        name = f"obj{start + i}_" + symbol.replace(".", "_")
+        out += _a2l_block(kind, name, symbol, rng.choice(A2L_TYPES), 0x70000000 + 4 * (start + i),
+                          rng.random() < canape_density, kind == "CHARACTERISTIC" and rng.random() < ext_limits)
+    out += ["  /end MODULE\n", "/end PROJECT\n"]
+    return "".join(out)
+
+def write_a2l(path: str, n_objects: int, symbols: List[str], **params) -> str:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(generate_a2l(n_objects, symbols, **params))
+    return path
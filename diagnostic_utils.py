@@ -1,4 +1,4 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from TestPackage.Controller.Diagnostics.dtcinfo import DTCInfo
 from TestPackage.config.config_manager import ConfigManager
 from TestPackage.report.test_report_context import add_table, add_step, add_diagnostic_tx_rx_group
@@ -133,69 +133,70 @@ def parse_to_int_or_hex(value: str) -> str:
     return f"0x{int(value):02X}"
 
 
+class DTCRuleIndex:
+    """
+    Allowed, muted and expected rules compiled once: a hash index from normalized DTC code
+    (parse_to_int_or_hex) to the first rule with that code, in the order Allowed > Muted > Expected
+    and then list order, i.e. the rule a linear scan would hit first.
+    Status keys are normalized once as well; matching compares them exactly as status_matches does.
+    """
+
+    def __init__(self, allowed_dtcs: List[DTCInfo], muted_dtcs: List[DTCInfo], expected_dtcs: List[DTCInfo]):
+        # code -> (type_name, "code+status" or the error raised when formatting it, status key, status is "any")
+        self._rules: Dict[str, Tuple[str, Any, Optional[str], bool]] = {}
+        for type_name, rules in ((STATUS_ALLOWED, allowed_dtcs), (STATUS_MUTED, muted_dtcs), (STATUS_EXPECTED, expected_dtcs)):
+            for rule in rules:
+                try:
+                    code = parse_to_int_or_hex(rule.DTC)
+                except Exception as e:
+                    print(f"Invalid DTC rule code {rule.DTC!r} ({type_name}): {e}")  # such a rule never matches
+                    continue
+                if code in self._rules:
+                    continue
+                any_status = rule.status == STATUS_ANY
+                try:
+                    status_key = parse_to_int_or_hex(rule.status)
+                    plus: Any = f"{code}+{status_key}"
+                except Exception as e:
+                    # Raised only if a DUT DTC hits this rule, as a linear scan would
+                    status_key, plus = None, e
+                self._rules[code] = (type_name, plus, status_key, any_status)
+
+    def evaluate(self, dtc_code: str, dtc_status: str) -> List[str]:
+        """Results-table row for a DUT DTC given its normalized code and status."""
+        hit = self._rules.get(dtc_code)
+        if hit is None:
+            return [dtc_code, dtc_status, "Present", "Unexpected", "", "fail"]
+        type_name, plus, status_key, any_status = hit
+        if isinstance(plus, Exception):
+            raise plus
+        if any_status:
+            # Expected DTCs with "status=any" pass; muted/allowed ones result in "none"
+            result = "pass" if type_name == STATUS_EXPECTED else "none"
+        elif dtc_status == status_key:
+            result = "none" if type_name in (STATUS_ALLOWED, STATUS_MUTED) else "pass"
+        else:
+            result = "fail"
+        return [dtc_code, dtc_status, "Present", type_name, plus, result]
+
+
 def build_comprehensive_dtc_results_table(
         dut_dtcs: List[DTCInfo],
         allowed_dtcs: List[DTCInfo],
         muted_dtcs: List[DTCInfo],
-        expected_dtcs: List[DTCInfo]
+        expected_dtcs: List[DTCInfo],
+        rule_index: Optional[DTCRuleIndex] = None
 ) -> Dict[str, Any]:
     """
     Builds a comprehensive results table for DTC evaluation.
     Handles special cases for "status=any" in expected and muted rules.
+    Pass rule_index to reuse rules compiled for an earlier call; the rule lists are then ignored.
     """
+    if rule_index is None:
+        rule_index = DTCRuleIndex(allowed_dtcs, muted_dtcs, expected_dtcs)
     table_data = []
-    rule_sets = [
-        (STATUS_ALLOWED, allowed_dtcs),
-        (STATUS_MUTED, muted_dtcs),
-        (STATUS_EXPECTED, expected_dtcs),
-    ]
     for dut in dut_dtcs:
-        dtc_code = parse_to_int_or_hex(dut.DTC)
-        dtc_status = parse_to_int_or_hex(dut.status)
-        found = False
-        for type_name, rules in rule_sets:
-            for rule in rules:
-                if dtc_matches_code(dut, rule):
-                    dtc_plus_status = f"{parse_to_int_or_hex(rule.DTC)}+{parse_to_int_or_hex(rule.status)}"
-
-                    # Handle "status=any" for specific rule types
-                    if rule.status == STATUS_ANY:
-                        if type_name == STATUS_EXPECTED:
-                            result = "pass"  # Expected DTCs with "status=any" should pass
-                        elif type_name in [STATUS_ALLOWED, STATUS_MUTED]:
-                            result = "none"  # Muted/Allowed DTCs with "status=any" should result in "none"
-                    else:
-                        # Regular status matching logic
-                        if status_matches(dut.status, rule.status):
-                            result = "none" if type_name in [STATUS_ALLOWED, STATUS_MUTED] else "pass"
-                        else:
-                            result = "fail"
-
-                    row = [
-                        dtc_code,
-                        dtc_status,
-                        "Present",
-                        type_name,
-                        dtc_plus_status,
-                        result
-                    ]
-                    table_data.append(row)
-                    found = True
-                    break
-            if found:
-                break
-
-        # If no match is found, mark as "Unexpected"
-        if not found:
-            row = [
-                dtc_code,
-                dtc_status,
-                "Present",
-                "Unexpected",
-                "",
-                "fail"
-            ]
-            table_data.append(row)
+        table_data.append(rule_index.evaluate(parse_to_int_or_hex(dut.DTC), parse_to_int_or_hex(dut.status)))
     return {
         "name": "DTC Comprehensive Evaluation",
         "column_header": ["DTC", "Status", "Present/Not present", "Type", "DTC+Status", "Result"],
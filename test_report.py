@@ -1,20 +1,65 @@
+# get_case_status(lines) gives the case status of an in-memory report. Streamed reports
+# (stream_path) no longer hold their lines, so they use the worst status of the written top-level
+# lines instead (_worse_status), which equals get_case_status only if that is a worst-of as well.
 from .status import get_case_status
+import json
 from datetime import datetime
 from contextlib import contextmanager
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Worst-status ranking shared by group aggregation (higher wins; unknown statuses rank 0)
+_STATUS_PRIORITY = {"ERROR": 3, "FAIL": 2, "PASS": 1, "INFO": 0, "NONE": 0}
+# Table row order by 'result' cell: FAIL > PASS > NONE > others
+_RESULT_ORDER = {'FAIL': 0, 'PASS': 1, 'NONE': 2}
+
+def _worse_status(current, status):
+    """current, or status if it ranks strictly higher (the first status of the highest rank wins)."""
+    if _STATUS_PRIORITY.get(status, 0) > _STATUS_PRIORITY.get(current, 0):
+        return status
+    return current
 
 def get_group_status(children):
-    priority = {"ERROR": 3, "FAIL": 2, "PASS": 1, "INFO": 0, "NONE": 0}
     group_status = "NONE"
     for child in children:
         status = child.get("status", "NONE")
         if child.get("category") == "GROUP":
             status = get_group_status(child.get("children", []))
             child["status"] = status
-        if priority.get(status, 0) > priority.get(group_status, 0):
-            group_status = status
+        group_status = _worse_status(group_status, status)
     return group_status
 
+def _result_column(table):
+    for idx, h in enumerate(table.get("column_header", []) or []):
+        if h.strip().lower() == "result":
+            return idx
+    return None
+
+def _sort_table_rows(table):
+    """Sort rows FAIL > PASS > NONE > others by the 'result' column (stable; no-op without one)."""
+    result_idx = _result_column(table)
+    if result_idx is not None:
+        table.get("data", []).sort(key=lambda row: _RESULT_ORDER.get(
+            str(row[result_idx]).strip().upper() if len(row) > result_idx else "", 3))
+
+def _table_status(table):
+    """Status of get_table_status computed in one pass, without sorting the rows."""
+    result_idx = _result_column(table)
+    if result_idx is not None:
+        cells = (row[result_idx] for row in table.get("data", []) if len(row) > result_idx)
+    else:
+        cells = (cell for row in table.get("data", []) for cell in row)
+    has_pass = False
+    for val in cells:
+        if isinstance(val, str):
+            v = val.strip().upper()
+            if v == "FAIL":
+                return "FAIL"
+            if v == "PASS":
+                has_pass = True
+    return "PASS" if has_pass else "NONE"
+
 def get_table_status(table):
     """
     If the table has a column named 'result', check only that column.
@@ -24,58 +69,139 @@ def get_table_status(table):
     Also: sorts the table rows as FAIL > PASS > NONE > others.
     Works even if column_header or row_header are missing.
     """
-    result_idx = None
-    headers = table.get("column_header", [])
-    if headers:
-        for idx, h in enumerate(headers):
-            if h.strip().lower() == "result":
-                result_idx = idx
-                break
-    if result_idx is not None:
-        priority = {'FAIL': 0, 'PASS': 1, 'NONE': 2}
-        data = table.get("data", [])
-        data.sort(key=lambda row: priority.get(str(row[result_idx]).strip().upper(), 3))
-        found = False
-        has_pass = False
-        for row in data:
-            if len(row) > result_idx:
-                val = row[result_idx]
-                found = True
-                if isinstance(val, str):
-                    v = val.strip().upper()
-                    if v == "FAIL":
-                        return "FAIL"
-                    if v == "PASS":
-                        has_pass = True
-        if found and has_pass:
-            return "PASS"
-        if found:
-            return "NONE"
-        return "NONE"
-    # Fallback: any cell FAIL, any cell PASS, else NONE
-    found = False
-    has_pass = False
-    for row in table.get("data", []):
-        for cell in row:
-            if isinstance(cell, str):
-                found = True
-                v = cell.strip().upper()
-                if v == "FAIL":
-                    return "FAIL"
-                if v == "PASS":
-                    has_pass = True
-    if found and has_pass:
-        return "PASS"
-    if found:
-        return "NONE"
-    return "NONE"
-
-def _normalize_chart_input(input_obj: Any) -> Dict[str, Any]:
+    _sort_table_rows(table)
+    return _table_status(table)
+
+# Point budget of the shared X axis per chart, and the decimation applied to reach it:
+# "minmax" (min and max sample per bucket), "lttb" (largest triangle three buckets) or "none".
+CHART_MAX_POINTS = 4000
+CHART_DECIMATION = "minmax"
+
+def _as_series(x, y) -> Tuple[np.ndarray, np.ndarray]:
+    """Float arrays (no copy when already float) sorted by x."""
+    x = np.asarray(x, dtype=float).reshape(-1)
+    y = np.asarray(y, dtype=float).reshape(-1)
+    n = min(len(x), len(y))
+    x, y = x[:n], y[:n]
+    if n > 1 and np.any(np.diff(x) < 0):
+        order = np.argsort(x, kind="stable")
+        x, y = x[order], y[order]
+    return x, y
+
+def _time_bucket_starts(x: np.ndarray, start: float, span: float, buckets: int) -> np.ndarray:
+    """First index of every non-empty time bucket; buckets split [start, start + span] evenly."""
+    if span <= 0:
+        return np.zeros(1, dtype=np.int64)
+    b = np.minimum(((x - start) * (buckets / span)).astype(np.int64), buckets - 1)
+    return np.flatnonzero(np.r_[True, b[1:] != b[:-1]])
+
+def _minmax_indices(y: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Index of the first minimum and first maximum of every bucket (NaN ignored)."""
+    n = len(y)
+    bucket_of = np.repeat(np.arange(len(starts)), np.diff(np.append(starts, n)))
+    picks = []
+    for reduce in (np.fmin, np.fmax):
+        extreme = reduce.reduceat(y, starts)
+        hit = np.flatnonzero(y == extreme[bucket_of])
+        _, first = np.unique(bucket_of[hit], return_index=True)
+        picks.append(hit[first])
+    return np.concatenate(picks)
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Largest-triangle-three-buckets selection of threshold indices (first and last always kept)."""
+    n = len(y)
+    if threshold < 3 or n <= threshold:
+        return np.arange(n)
+    yf = np.where(np.isnan(y), 0.0, y)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    picks = np.empty(threshold, dtype=np.int64)
+    picks[0], picks[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = edges[i], max(edges[i + 1], edges[i] + 1)
+        nxt_lo, nxt_hi = hi, (edges[i + 2] if i + 2 < len(edges) else n)
+        avg_x = x[nxt_lo:nxt_hi].mean() if nxt_hi > nxt_lo else x[n - 1]
+        avg_y = yf[nxt_lo:nxt_hi].mean() if nxt_hi > nxt_lo else yf[n - 1]
+        area = np.abs((x[a] - avg_x) * (yf[lo:hi] - yf[a]) - (x[a] - x[lo:hi]) * (avg_y - yf[a]))
+        a = lo + int(np.argmax(area))
+        picks[i + 1] = a
+    return picks
+
+def _kept_timestamps(series: List[Tuple[np.ndarray, np.ndarray]], max_points: int, method: str) -> np.ndarray:
+    """
+    Timestamps of the shared X axis. Each series is decimated on its own timestamps (min/max per
+    shared time bucket, or LTTB) and the kept timestamps of all series are merged, so every
+    series' extremes land on the axis at their real time.
+    """
+    if method not in ("minmax", "lttb", "none"):
+        raise ValueError(f"Unknown chart decimation '{method}' (expected 'minmax', 'lttb' or 'none')")
+    non_empty = [(x, y) for x, y in series if len(x)]
+    if not non_empty:
+        return np.empty(0)
+    all_x = np.unique(np.concatenate([x for x, _ in non_empty]))
+    if method == "none" or not max_points or len(all_x) <= max_points:
+        return all_x
+    kept = []
+    if method == "minmax":
+        start = min(x[0] for x, _ in non_empty)
+        span = max(x[-1] for x, _ in non_empty) - start
+        buckets = max(1, max_points // (2 * len(non_empty)))
+        for x, y in non_empty:
+            kept.append(x[_minmax_indices(y, _time_bucket_starts(x, start, span, buckets))])
+    else:
+        threshold = max(3, max_points // len(non_empty))
+        for x, y in non_empty:
+            kept.append(x[_lttb_indices(x, y, threshold)])
+    kept += [x[[0, -1]] for x, _ in non_empty]
+    return np.unique(np.concatenate(kept))
+
+def _hold_on(grid: np.ndarray, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Zero-order hold of series (x, y) at grid: last sample at or before each time, NaN outside the series."""
+    if not len(x):
+        return np.full(len(grid), np.nan)
+    idx = np.searchsorted(x, grid, side="right") - 1
+    out = y[np.clip(idx, 0, len(y) - 1)].astype(float)
+    out[(idx < 0) | (grid > x[-1])] = np.nan
+    return out
+
+def _chart_from_series(names: List[str], series: List[Tuple[Any, Any]],
+                       max_points: int, decimation: str) -> Dict[str, Any]:
+    series = [_as_series(sx, sy) for sx, sy in series]
+    x = _kept_timestamps(series, max_points, decimation)
+    return {
+        "name": "Signals",
+        "legend": names,
+        "x": x,
+        "y": {name: _hold_on(x, sx, sy) for name, (sx, sy) in zip(names, series)},
+        "xlabel": "Time (s)",
+        "ylabel": "Value",
+    }
+
+def _to_json_list(values: Any) -> Any:
+    """NumPy array -> list for the report payload; NaN (gaps) becomes None."""
+    if isinstance(values, np.ndarray):
+        if values.dtype.kind == "f" and np.isnan(values).any():
+            return np.where(np.isnan(values), None, values).tolist()
+        return values.tolist()
+    return values
+
+def _chart_payload(chart: Dict[str, Any]) -> Dict[str, Any]:
+    out = dict(chart)
+    out["x"] = _to_json_list(chart.get("x"))
+    y = chart.get("y")
+    out["y"] = {k: _to_json_list(v) for k, v in y.items()} if isinstance(y, dict) else _to_json_list(y)
+    return out
+
+def _normalize_chart_input(input_obj: Any, max_points: Optional[int] = None, decimation: Optional[str] = None) -> Dict[str, Any]:
     """
     Accept multiple input forms and convert to a chart dict compatible with the frontend:
       - [rec["Sig1"], rec["Sig2"]] where each item has .name, .x, .y, .data
       - rec.values() -> list of objects with .name, .x, .y, .data
       - [[(x0,y0),...], [(x0,y0),...]] -> each inner list is one signal's samples
+    Signals are decimated on their own timestamps to max_points (default CHART_MAX_POINTS) with
+    decimation (default CHART_DECIMATION); the kept timestamps of all signals form the shared X axis
+    and each signal is held (zero-order) at the others' timestamps. x and y stay NumPy arrays until
+    TestReport.to_dict.
     Output dict:
       {
         "name": "Signals",
@@ -86,6 +212,8 @@ def _normalize_chart_input(input_obj: Any) -> Dict[str, Any]:
         "ylabel": "Value"
       }
     """
+    max_points = CHART_MAX_POINTS if max_points is None else max_points
+    decimation = CHART_DECIMATION if decimation is None else decimation
     # Case 1: list/tuple of views or sample-pairs
     if isinstance(input_obj, (list, tuple)):
         items = list(input_obj)
@@ -93,42 +221,70 @@ def _normalize_chart_input(input_obj: Any) -> Dict[str, Any]:
             return {"name": "Signals", "legend": [], "x": [], "y": {}}
         # Duck-typing for view-like objects
         if hasattr(items[0], "x") and hasattr(items[0], "y"):
-            # Use the first item's x as the common X axis
-            x = list(map(float, getattr(items[0], "x")))
             legend = []
-            y_map: Dict[str, List[float]] = {}
             for it in items:
-                name = getattr(it, "name", None) or f"Sig{len(legend)+1}"
-                legend.append(name)
-                y_map[name] = list(map(float, getattr(it, "y")))
-            return {
-                "name": "Signals",
-                "legend": legend,
-                "x": x,
-                "y": y_map,
-                "xlabel": "Time (s)",
-                "ylabel": "Value",
-            }
+                legend.append(getattr(it, "name", None) or f"Sig{len(legend)+1}")
+            return _chart_from_series(legend, [(it.x, it.y) for it in items], max_points, decimation)
         # Otherwise, assume list of list of (x,y) pairs
         elif isinstance(items[0], (list, tuple)) and items and items[0] and isinstance(items[0][0], (list, tuple)):
-            sig_pairs: List[List[Tuple[float, float]]] = items  # type: ignore
-            x = [float(p[0]) for p in sig_pairs[0]]
-            legend = [f"Sig{i+1}" for i in range(len(sig_pairs))]
-            y_map = {legend[i]: [float(p[1]) for p in sig_pairs[i]] for i in range(len(sig_pairs))}
-            return {
-                "name": "Signals",
-                "legend": legend,
-                "x": x,
-                "y": y_map,
-                "xlabel": "Time (s)",
-                "ylabel": "Value",
-            }
+            legend = [f"Sig{i+1}" for i in range(len(items))]
+            pairs = [np.asarray(sig, dtype=float).reshape(-1, 2) for sig in items]
+            return _chart_from_series(legend, [(p[:, 0], p[:, 1]) for p in pairs], max_points, decimation)
     # If already a dict in chart format, return as-is
     if isinstance(input_obj, dict):
         return input_obj
     # Fallback empty chart
     return {"name": "Signals", "legend": [], "x": [], "y": {}}
 
+# ---------------------------------------------------------------------------
+# Streamed reports (JSON lines)
+# ---------------------------------------------------------------------------
+# One JSON object per line, tagged by "kind":
+#   {"kind": "report", "format": 1, "name", "goal", "requirements", "project", "dut"}   (first line)
+#   {"kind": "line", "line": {...}}       finished top-level step/table/chart entry or group
+#   {"kind": "table", "idx": i, "table": {...}}
+#   {"kind": "chart", "idx": i, "chart": {...}}
+#   {"kind": "end", "status": ..., "index": ...}                                       (on close)
+
+REPORT_STREAM_FORMAT = 1
+
+def read_report_stream(path):
+    """
+    Rebuild the to_dict() structure from a streamed report. A stream without its end record
+    (run aborted) still loads; its status is then the worst status of the lines written, as
+    TestReport.status tracks it while streaming.
+    """
+    res = {"name": None, "goal": None, "requirements": [], "lines": [], "tables": [], "charts": [],
+           "status": None, "project": None, "index": None, "dut": {}}
+    ended = False
+    with open(path, "r", encoding="utf-8") as f:
+        for raw in f:
+            if not raw.strip():
+                continue
+            try:
+                rec = json.loads(raw)
+            except ValueError:
+                break  # torn last record of an aborted run
+            kind = rec.get("kind")
+            if kind == "report":
+                for key in ("name", "goal", "requirements", "project", "dut"):
+                    res[key] = rec.get(key, res[key])
+            elif kind == "line":
+                res["lines"].append(rec["line"])
+            elif kind == "table":
+                res["tables"].append(rec["table"])
+            elif kind == "chart":
+                res["charts"].append(rec["chart"])
+            elif kind == "end":
+                res["status"], res["index"] = rec.get("status"), rec.get("index")
+                ended = True
+    if not ended:
+        status = "NONE"
+        for line in res["lines"]:
+            status = _worse_status(status, line.get("status", "NONE"))
+        res["status"] = status
+    return res
+
 class TestReport:
     project = None
 
@@ -136,7 +292,12 @@ class TestReport:
     def set_project(cls, project_name):
         cls.project = project_name
 
-    def __init__(self, name, goal=None, requirements=None, dut=None):
+    def __init__(self, name, goal=None, requirements=None, dut=None, stream_path=None):
+        """
+        stream_path: write the report as JSON lines while it is built (read it back with
+        read_report_stream). Finished top-level lines, tables and charts go to the file instead of
+        being kept in memory; only open groups and status summaries stay resident.
+        """
         self.name = name
         self.goal = goal
         self.requirements = requirements or []
@@ -146,8 +307,67 @@ class TestReport:
         self.status = get_case_status(self.lines)
         self.project = TestReport.project
         self._group_stack = []
+        # Per open group: running worst status of its children and diagnostic groups added to it
+        self._group_worst: List[str] = []
+        self._group_diagnostics: List[List[Dict[str, Any]]] = []
+        self._unsorted_tables: List[Dict[str, Any]] = []
+        self._n_tables = 0
+        self._n_charts = 0
         self.dut = dut or {}
         self.steps = []  # Optional: keep if other code references it
+        self.stream_path = stream_path
+        self._stream = None
+        # Streaming: running worst status of the top-level lines already written
+        self._stream_worst = "NONE"
+        if stream_path:
+            self._stream = open(stream_path, "w", encoding="utf-8")
+            self._write_record({"kind": "report", "format": REPORT_STREAM_FORMAT, "name": self.name,
+                                "goal": self.goal, "requirements": self.requirements,
+                                "project": self.project, "dut": self.dut})
+
+    @property
+    def status(self):
+        """
+        Case status; get_case_status runs on read after the report changed, not on every append.
+        Streamed reports: worst status of the written top-level lines and of every group still open.
+        """
+        if self._status_dirty:
+            if self.stream_path:
+                status = self._stream_worst
+                for group_status in self._group_worst:
+                    status = _worse_status(status, group_status)
+                self._status = status
+            else:
+                self._status = get_case_status(self.lines)
+            self._status_dirty = False
+        return self._status
+
+    @status.setter
+    def status(self, value):
+        self._status = value
+        self._status_dirty = False
+
+    def _write_record(self, record):
+        if self._stream is None:
+            raise RuntimeError(f"Report stream '{self.stream_path}' is already closed")
+        self._stream.write(json.dumps(record, default=str) + "\n")
+        self._stream.flush()
+
+    def _emit_top_level(self, entry, status):
+        """Streaming: write a finished top-level line; only its status is kept (running worst)."""
+        self._write_record({"kind": "line", "line": entry})
+        self._stream_worst = _worse_status(self._stream_worst, status)
+
+    def _append_line(self, entry, status):
+        """Append entry to the open group (raising its running worst status) or to the top level."""
+        if self._group_stack:
+            self._group_stack[-1]["children"].append(entry)
+            self._group_worst[-1] = _worse_status(self._group_worst[-1], status)
+        elif self.stream_path:
+            self._emit_top_level(entry, status)
+        else:
+            self.lines.append(entry)
+        self._status_dirty = True
 
     @contextmanager
     def start_group(self, title, comment=None):
@@ -161,15 +381,25 @@ class TestReport:
         }
         if self._group_stack:
             self._group_stack[-1]["children"].append(group)
-        else:
+        elif not self.stream_path:
             self.lines.append(group)
         self._group_stack.append(group)
+        self._group_worst.append("NONE")
+        self._group_diagnostics.append([])
         try:
             yield
         finally:
             self._group_stack.pop()
-            group["status"] = get_group_status(group["children"])
-            self.status = get_case_status(self.lines)
+            status = self._group_worst.pop()
+            # get_group_status re-derives nested group statuses from their children
+            for diag_group in self._group_diagnostics.pop():
+                diag_group["status"] = get_group_status(diag_group["children"])
+            group["status"] = status
+            if self._group_stack:
+                self._group_worst[-1] = _worse_status(self._group_worst[-1], status)
+            elif self.stream_path:
+                self._emit_top_level(group, status)
+            self._status_dirty = True
 
     def add_step(self, status, comment):
         step = {
@@ -178,11 +408,7 @@ class TestReport:
             "comment": comment,
             "timestamp": datetime.now().strftime("%H:%M:%S")
         }
-        if self._group_stack:
-            self._group_stack[-1]["children"].append(step)
-        else:
-            self.lines.append(step)
-        self.status = get_case_status(self.lines)
+        self._append_line(step, status)
 
     def add_table(self, name, data, column_header=None, row_header=None):
         """
@@ -193,7 +419,8 @@ class TestReport:
         - row_header (list, optional): List of row header strings.
         All arguments except 'name' and 'data' are optional.
         """
-        idx = len(self.tables)
+        idx = self._n_tables
+        self._n_tables += 1
         table_dict = {
             "name": name,
             "data": data
@@ -202,8 +429,14 @@ class TestReport:
             table_dict["column_header"] = column_header
         if row_header is not None:
             table_dict["row_header"] = row_header
-        self.tables.append(table_dict)
-        table_status = get_table_status(table_dict)
+        # Rows are put in FAIL > PASS > NONE order by to_dict; status needs no sorting
+        table_status = _table_status(table_dict)
+        if self.stream_path:
+            _sort_table_rows(table_dict)
+            self._write_record({"kind": "table", "idx": idx, "table": table_dict})
+        else:
+            self.tables.append(table_dict)
+            self._unsorted_tables.append(table_dict)
         table_entry = {
             "category": "TABLE",
             "status": table_status,
@@ -211,23 +444,25 @@ class TestReport:
             "timestamp": datetime.now().strftime("%H:%M:%S"),
             "table_idx": idx
         }
-        if self._group_stack:
-            self._group_stack[-1]["children"].append(table_entry)
-        else:
-            self.lines.append(table_entry)
-        self.status = get_case_status(self.lines)
+        self._append_line(table_entry, table_status)
 
-    def add_chart(self, chart):
+    def add_chart(self, chart, max_points=None, decimation=None):
         """
         Add a chart. Accepted inputs:
           - A ready chart dict with keys: x, y (array or dict), legend (optional), name (optional)
           - A list like [rec["Sig1"], rec["Sig2"]] where each item has .name, .x, .y, .data
           - rec.values() from RecorderResult
           - A list of signals as pairs: [[(x0,y0),...], [(x0,y0),...]]
+        Signals are decimated to about max_points X values in total (default CHART_MAX_POINTS) using
+        decimation: "minmax", "lttb" or "none" (default CHART_DECIMATION), then share one X axis.
         """
-        normalized = _normalize_chart_input(chart)
-        idx = len(self.charts)
-        self.charts.append(normalized)
+        normalized = _normalize_chart_input(chart, max_points, decimation)
+        idx = self._n_charts
+        self._n_charts += 1
+        if self.stream_path:
+            self._write_record({"kind": "chart", "idx": idx, "chart": _chart_payload(normalized)})
+        else:
+            self.charts.append(normalized)
         chart_entry = {
             "category": "CHART",
             "status": "NONE",
@@ -235,11 +470,7 @@ class TestReport:
             "timestamp": datetime.now().strftime("%H:%M:%S"),
             "chart_idx": idx
         }
-        if self._group_stack:
-            self._group_stack[-1]["children"].append(chart_entry)
-        else:
-            self.lines.append(chart_entry)
-        self.status = get_case_status(self.lines)
+        self._append_line(chart_entry, "NONE")
 
     def condition(self, cond: bool, description: str, comment: str = ""):
         status = "PASS" if cond else "FAIL"
@@ -266,13 +497,28 @@ class TestReport:
             "children": [diagnostic]
         }
         if self._group_stack:
-            self._group_stack[-1]["children"].append(group)
-        else:
-            self.lines.append(group)
-        self.status = get_case_status(self.lines)
+            self._group_diagnostics[-1].append(group)
+        self._append_line(group, get_group_status(group["children"]))
+
+    def close(self):
+        """Streaming: write the end record (final status) and close the file. No-op otherwise."""
+        if self._stream:
+            self._write_record({"kind": "end", "status": self.status, "index": getattr(self, "index", None)})
+            self._stream.close()
+            self._stream = None
 
     def to_dict(self):
-        from .status import get_case_status
+        if self.stream_path:
+            # Loads the whole streamed report back; frontends can use read_report_stream on the file instead
+            if self._stream:
+                self._stream.flush()
+            res = read_report_stream(self.stream_path)
+            res["status"] = self.status
+            res["index"] = getattr(self, "index", None)
+            return res
+        for table in self._unsorted_tables:
+            _sort_table_rows(table)
+        self._unsorted_tables = []
         self.status = get_case_status(self.lines)
         res = {
             "name": self.name,
@@ -280,7 +526,7 @@ class TestReport:
             "requirements": self.requirements,
             "lines": self.lines,
             "tables": self.tables,
-            "charts": self.charts,
+            "charts": [_chart_payload(c) for c in self.charts],
             "status": self.status,
             "project": self.project,
             "index": getattr(self, "index", None),
@@ -0,0 +1,83 @@
+import importlib
+import os
+import sys
+import types
+
+import pytest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+A2L_DATA = os.path.join(REPO_DIR, "tests", "data", "a2l")
+
+_PRIORITY = {"ERROR": 3, "FAIL": 2, "PASS": 1}
+
+
+def _worst_of(lines):
+    status = "NONE"
+    for line in lines:
+        line_status = line.get("status")
+        if line.get("category") == "GROUP":
+            line_status = _worst_of(line.get("children", []))
+        if _PRIORITY.get(line_status, 0) > _PRIORITY.get(status, 0):
+            status = line_status
+    return status
+
+
+@pytest.fixture(scope="module")
+def test_report():
+    # test_report.py lives in a package next to a status module that is not part of this tree;
+    # the stand-in get_case_status is the worst-of (groups by their children) the streamed status assumes
+    pkg = types.ModuleType("report_pkg")
+    pkg.__path__ = [REPO_DIR]
+    status = types.ModuleType("report_pkg.status")
+    status.get_case_status = _worst_of
+    sys.modules["report_pkg"] = pkg
+    sys.modules["report_pkg.status"] = status
+    try:
+        yield importlib.import_module("report_pkg.test_report")
+    finally:
+        for name in ("report_pkg.test_report", "report_pkg.status", "report_pkg"):
+            sys.modules.pop(name, None)
+
+
+@pytest.fixture(scope="session")
+def a2l():
+    """The extensionless v3_a2l script, imported as the benchmarks do."""
+    from benchmarks.run import load_tool
+    return load_tool()
+
+
+@pytest.fixture
+def a2l_run(a2l, tmp_path):
+    """Run a v3_a2l command line (without the program name); the report goes to tmp_path."""
+    def run(*argv):
+        rc = a2l._main(["v3_a2l", *argv, "--report", str(tmp_path / "report.txt")])
+        assert rc in (0, None)
+    return run
+
+
+@pytest.fixture
+def a2l_input(tmp_path):
+    """Copy of tests/data/a2l/<name> in tmp_path, optionally with CRLF line ends."""
+    def copy(name, crlf=False):
+        data = open(os.path.join(A2L_DATA, name), "rb").read()
+        if crlf:
+            data = data.replace(b"\n", b"\r\n")
+        path = tmp_path / (name.replace(".a2l", "_crlf.a2l") if crlf else name)
+        path.write_bytes(data)
+        return str(path)
+    return copy
+
+
+
+@pytest.fixture
+def a2l_golden():
+    """Expected output tests/data/a2l/expected/<name>, as bytes."""
+    def read(name):
+        with open(os.path.join(A2L_DATA, "expected", name), "rb") as f:
+            return f.read()
+    return read
+
+
+@pytest.fixture
+def a2l_data():
+    return A2L_DATA
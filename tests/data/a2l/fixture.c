@@ -0,0 +1,18 @@
+/* ELF for the A2L golden tests; rebuild with:
+ *   gcc -g -O0 -nostdlib -static -fno-asynchronous-unwind-tables -fdebug-prefix-map=$PWD=. \
+ *       -Wl,--build-id=none -Wl,-e,main -o fixture.elf fixture.c
+ * Addresses in expected/ depend on this binary; regenerate them when it changes. */
+#include <stdint.h>
+typedef struct { uint8_t a; uint16_t b; float c[3]; } Inner;
+typedef struct { Inner items[4]; int32_t count; union { uint32_t u; float f; } uv; } Outer;
+typedef struct { Outer StandardFaultDataSet; uint8_t flags[40]; } Slot;
+Slot ErrStoreMgr[2];
+volatile uint32_t gCounter = 5;
+double gGain = 1.5;
+int16_t gTable[8];
+Inner gInner;
+enum Mode { A, B } gMode;
+static uint8_t sLocal;
+char *gPtr;
+uint8_t *touch(void) { sLocal++; return &sLocal; }
+int main(void) { return (int)gCounter + touch()[0]; }
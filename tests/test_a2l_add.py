@@ -0,0 +1,44 @@
+"""add against golden outputs: measurements and characteristics, CRLF input, in-place writes over a mapped input."""
+
+import os
+
+MEASUREMENTS = "gInner,ErrStoreMgr._0_.StandardFaultDataSet.items._1_,gPtr"
+
+
+def read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_add_measurements(a2l_run, a2l_golden, a2l_data, tmp_path):
+    out = str(tmp_path / "added.a2l")
+    a2l_run("add", os.path.join(a2l_data, "base.a2l"), os.path.join(a2l_data, "fixture.elf"),
+            MEASUREMENTS, "measurement", out)
+    assert read(out) == a2l_golden("add_measurement.a2l")
+
+
+def test_add_characteristics(a2l_run, a2l_golden, a2l_data, tmp_path):
+    out = str(tmp_path / "added.a2l")
+    a2l_run("add", os.path.join(a2l_data, "base.a2l"), os.path.join(a2l_data, "fixture.elf"),
+            "[gTable, gMode, gCounter]", "characteristic", out)
+    assert read(out) == a2l_golden("add_characteristic.a2l")
+
+
+def test_add_crlf_input(a2l_run, a2l_input, a2l_golden, a2l_data, tmp_path):
+    out = str(tmp_path / "added.a2l")
+    a2l_run("add", a2l_input("base.a2l", crlf=True), os.path.join(a2l_data, "fixture.elf"),
+            MEASUREMENTS, "measurement", out)
+    assert read(out) == a2l_golden("add_measurement.a2l")
+
+
+def test_add_in_place(a2l_run, a2l_input, a2l_golden, a2l_data):
+    # The input is memory-mapped while the output is written over it
+    base = a2l_input("base.a2l")
+    a2l_run("add", base, os.path.join(a2l_data, "fixture.elf"), MEASUREMENTS, "measurement", base)
+    assert read(base) == a2l_golden("add_measurement.a2l")
+
+
+def test_add_in_place_crlf(a2l_run, a2l_input, a2l_golden, a2l_data):
+    base = a2l_input("base.a2l", crlf=True)
+    a2l_run("add", base, os.path.join(a2l_data, "fixture.elf"), MEASUREMENTS, "measurement", base)
+    assert read(base) == a2l_golden("add_measurement.a2l")
@@ -0,0 +1,80 @@
+"""Address ranges of query --range / check --overlaps: MEASUREMENT datatype and CHARACTERISTIC record layout sizes."""
+
+A2L = """\
+/begin PROJECT P ""
+  /begin MODULE M ""
+    /begin RECORD_LAYOUT Lookup_U32
+      FNC_VALUES 1 ULONG COLUMN_DIR DIRECT
+    /end RECORD_LAYOUT
+    /begin RECORD_LAYOUT RL_UWORD
+      FNC_VALUES 1 UWORD COLUMN_DIR DIRECT
+    /end RECORD_LAYOUT
+    /begin MEASUREMENT m_word ""
+      UWORD NO_COMPU_METHOD 0 0 0 65535
+      ECU_ADDRESS 0x70000000
+    /end MEASUREMENT
+    /begin MEASUREMENT m_array ""
+      SLONG NO_COMPU_METHOD 0 0 -2147483648 2147483647
+      ECU_ADDRESS 0x70000010
+      ARRAY_SIZE 3
+    /end MEASUREMENT
+    /begin CHARACTERISTIC c_word ""
+      VALUE 0x7000002C RL_UWORD 0 NO_COMPU_METHOD 0 65535
+    /end CHARACTERISTIC
+    /begin CHARACTERISTIC c_long ""
+      VALUE 0x70000040 RL_ULONG 0 NO_COMPU_METHOD 0 4294967295
+    /end CHARACTERISTIC
+    /begin CHARACTERISTIC c_lookup ""
+      VALUE 0x70000050 Lookup_U32 0 NO_COMPU_METHOD 0 4294967295
+    /end CHARACTERISTIC
+    /begin CHARACTERISTIC c_float ""
+      VALUE 0x70000060 RL_FLOAT64_IEEE 0 NO_COMPU_METHOD 0 1
+    /end CHARACTERISTIC
+  /end MODULE
+/end PROJECT
+"""
+
+
+def write(tmp_path, text):
+    path = tmp_path / "ranges.a2l"
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def intervals(a2l, path):
+    index = a2l.A2LAddressIndex.from_index(a2l._load_a2l_index(path))
+    return {index.blocks[i].name: index.interval(i) for i in range(len(index))}
+
+
+def test_block_sizes(a2l, tmp_path):
+    assert intervals(a2l, write(tmp_path, A2L)) == {
+        "m_word": (0x70000000, 0x70000002),
+        "m_array": (0x70000010, 0x7000001C),
+        "c_word": (0x7000002C, 0x7000002E),
+        "c_long": (0x70000040, 0x70000044),
+        "c_lookup": (0x70000050, 0x70000054),
+        "c_float": (0x70000060, 0x70000068),
+    }
+
+
+def test_query_range_uses_characteristic_size(a2l, tmp_path, capsys):
+    path = write(tmp_path, A2L)
+    assert [b.name for b in a2l.queryrange(path, 0x7000002D, 0x7000002E)] == ["c_word"]
+    assert [b.name for b in a2l.queryrange(path, 0x70000043, 0x70000050)] == ["c_long"]
+    assert [b.name for b in a2l.queryrange(path, 0x70000053, 0x70000061)] == ["c_lookup", "c_float"]
+    assert "[0x7000002C, 0x7000002E)" in capsys.readouterr().out
+
+
+def test_check_overlaps_uses_characteristic_size(a2l, tmp_path, capsys):
+    assert a2l.checkoverlaps(write(tmp_path, A2L)) == []
+    # A measurement on the third byte of c_long overlaps only if c_long is sized 4 bytes
+    text = A2L.replace("ECU_ADDRESS 0x70000000", "ECU_ADDRESS 0x70000042")
+    pairs = a2l.checkoverlaps(write(tmp_path, text))
+    assert [(p.name, q.name) for p, q in pairs] == [("c_long", "m_word")]
+    assert "1 overlap(s)" in capsys.readouterr().out
+
+
+def test_crlf_file_sizes(a2l, tmp_path):
+    path = tmp_path / "crlf.a2l"
+    path.write_bytes(A2L.replace("\n", "\r\n").encode("utf-8"))
+    assert intervals(a2l, str(path))["c_lookup"] == (0x70000050, 0x70000054)
@@ -0,0 +1,35 @@
+"""merge against golden outputs: LF and CRLF inputs, with and without --elf, and writing over the first input."""
+
+import os
+
+
+def read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_merge(a2l_run, a2l_golden, a2l_data, tmp_path):
+    out = str(tmp_path / "merged.a2l")
+    a2l_run("merge", out, *(os.path.join(a2l_data, n) for n in ("base.a2l", "second.a2l", "third.a2l")))
+    assert read(out) == a2l_golden("merge.a2l")
+
+
+def test_merge_with_elf(a2l_run, a2l_golden, a2l_data, tmp_path):
+    out = str(tmp_path / "merged.a2l")
+    a2l_run("merge", out, *(os.path.join(a2l_data, n) for n in ("base.a2l", "second.a2l", "third.a2l")),
+            "--elf", os.path.join(a2l_data, "fixture.elf"))
+    assert read(out) == a2l_golden("merge_elf.a2l")
+
+
+def test_merge_crlf_inputs(a2l_run, a2l_input, a2l_golden, a2l_data, tmp_path):
+    out = str(tmp_path / "merged.a2l")
+    a2l_run("merge", out, *(a2l_input(n, crlf=True) for n in ("base.a2l", "second.a2l", "third.a2l")),
+            "--elf", os.path.join(a2l_data, "fixture.elf"))
+    assert read(out) == a2l_golden("merge_elf.a2l")
+
+
+def test_merge_over_first_input(a2l_run, a2l_input, a2l_golden, a2l_data):
+    base = a2l_input("base.a2l")
+    a2l_run("merge", base, base, *(a2l_input(n) for n in ("second.a2l", "third.a2l")),
+            "--elf", os.path.join(a2l_data, "fixture.elf"))
+    assert read(base) == a2l_golden("merge_elf.a2l")
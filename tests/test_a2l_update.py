@@ -0,0 +1,43 @@
+"""update against a golden output: LF and CRLF input, DISPLAY insertions before later blocks, in-place writes."""
+
+import os
+
+
+def read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_update(a2l_run, a2l_golden, a2l_data, tmp_path):
+    out = str(tmp_path / "updated.a2l")
+    a2l_run("update", os.path.join(a2l_data, "base.a2l"), os.path.join(a2l_data, "fixture.elf"), out)
+    assert read(out) == a2l_golden("update.a2l")
+
+
+def test_update_inserts_display_before_later_blocks(a2l_run, a2l_data, tmp_path):
+    # gTable_3 has a CANAPE_EXT without DISPLAY; the blocks after it must still be patched at their own lines
+    out = str(tmp_path / "updated.a2l")
+    a2l_run("update", os.path.join(a2l_data, "base.a2l"), os.path.join(a2l_data, "fixture.elf"), out)
+    text = read(out).decode()
+    table = text[text.index("/begin MEASUREMENT gTable_3 "):text.index("/begin MEASUREMENT gTable_3b ")]
+    assert "DISPLAY 0 -32768 32767" in table
+    gain = text[text.index("/begin MEASUREMENT gGain "):text.index("/begin MEASUREMENT gMode ")]
+    assert "ECU_ADDRESS 0x300" not in gain
+
+
+def test_update_crlf_input(a2l_run, a2l_input, a2l_golden, a2l_data, tmp_path):
+    out = str(tmp_path / "updated.a2l")
+    a2l_run("update", a2l_input("base.a2l", crlf=True), os.path.join(a2l_data, "fixture.elf"), out)
+    assert read(out) == a2l_golden("update.a2l")
+
+
+def test_update_in_place(a2l_run, a2l_input, a2l_golden, a2l_data):
+    base = a2l_input("base.a2l")
+    a2l_run("update", base, os.path.join(a2l_data, "fixture.elf"), base)
+    assert read(base) == a2l_golden("update.a2l")
+
+
+def test_update_in_place_crlf(a2l_run, a2l_input, a2l_golden, a2l_data):
+    base = a2l_input("base.a2l", crlf=True)
+    a2l_run("update", base, os.path.join(a2l_data, "fixture.elf"), base)
+    assert read(base) == a2l_golden("update.a2l")
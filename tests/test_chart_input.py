@@ -0,0 +1,43 @@
+"""Chart decimation in test_report._normalize_chart_input (mixed rates, offsets, spikes, step signals)."""
+
+import types
+
+import numpy as np
+import pytest
+
+
+def view(name, x, y):
+    return types.SimpleNamespace(name=name, x=np.asarray(x, dtype=float), y=np.asarray(y, dtype=float))
+
+
+def test_offset_signals_keep_single_sample_spike(test_report):
+    n = 2_000_000
+    t = np.arange(n) * 0.001
+    a = np.sin(t)
+    a[1_234_567] = 9.0
+    chart = test_report._normalize_chart_input([view("a", t, a), view("b", t + 0.0005, np.cos(t))])
+    assert len(chart["x"]) <= test_report.CHART_MAX_POINTS + 4
+    assert np.nanmax(chart["y"]["a"]) == 9.0
+    assert t[1_234_567] in chart["x"]
+
+
+def test_mixed_rates_keep_spike_of_short_fast_signal(test_report):
+    slow_t = np.arange(0, 3600, 0.01)
+    fast_t = np.arange(0, 1, 0.001)
+    fast = np.zeros_like(fast_t)
+    fast[500] = 7.5
+    chart = test_report._normalize_chart_input([view("slow", slow_t, np.sin(slow_t)), view("fast", fast_t, fast)])
+    assert len(chart["x"]) <= test_report.CHART_MAX_POINTS + 4
+    assert np.nanmax(chart["y"]["fast"]) == 7.5
+    assert np.all(np.isnan(chart["y"]["fast"][chart["x"] > fast_t[-1]]))
+
+
+@pytest.mark.parametrize("decimation", ["minmax", "lttb", "none"])
+def test_step_signal_gets_no_intermediate_states(test_report, decimation):
+    enum_t = np.arange(0, 100, 0.1)
+    states = (np.arange(len(enum_t)) // 7) % 3
+    other_t = np.arange(0.03, 100, 0.0137)
+    chart = test_report._normalize_chart_input([view("enum", enum_t, states), view("other", other_t, np.sin(other_t))],
+                                               max_points=500, decimation=decimation)
+    held = chart["y"]["enum"]
+    assert set(np.unique(held[~np.isnan(held)])) <= {0.0, 1.0, 2.0}
@@ -0,0 +1,92 @@
+"""Streamed TestReport (stream_path) against the in-memory report, and read_report_stream on aborted runs."""
+
+import datetime as _dt
+import json
+
+import pytest
+
+
+class FixedDatetime(_dt.datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def fixed_clock(test_report, monkeypatch):
+    monkeypatch.setattr(test_report, "datetime", FixedDatetime)
+
+
+def build(report):
+    """Same script on any TestReport; returns the status after every call."""
+    statuses = []
+
+    def seen():
+        statuses.append(report.status)
+
+    report.add_step("PASS", "setup")
+    seen()
+    with report.start_group("outer"):
+        seen()
+        report.add_step("INFO", "outer info")
+        seen()
+        with report.start_group("inner"):
+            report.add_step("FAIL", "inner fail")
+            seen()
+            with report.start_group("innermost"):
+                report.add_step("ERROR", "deep error")
+                seen()
+            seen()
+        report.add_table("rows", [["a", "PASS"], ["b", "FAIL"], ["c", "NONE"]],
+                         column_header=["name", "result"])
+        seen()
+        report.add_diagnostic_tx_rx_group("nested", "22 F1 90", "62 F1 90", "62 F1 90", "PASS")
+        seen()
+    seen()
+    report.add_table("top", [["x", "PASS"]], column_header=["name", "result"])
+    report.add_chart({"name": "c", "legend": ["s"], "x": [0.0, 1.0], "y": {"s": [1.0, 2.0]}})
+    report.add_diagnostic_tx_rx_group("top", "10 03", "7F 10 22", "50 03", "FAIL")
+    seen()
+    report.close()
+    seen()
+    return statuses
+
+
+def test_stream_round_trip_matches_in_memory(test_report, fixed_clock, tmp_path):
+    path = tmp_path / "case.jsonl"
+    memory = test_report.TestReport("case", goal="g", requirements=["R1"], dut={"sw": "1.0"})
+    streamed = test_report.TestReport("case", goal="g", requirements=["R1"], dut={"sw": "1.0"},
+                                      stream_path=str(path))
+    assert build(streamed) == build(memory)
+    expected = json.loads(json.dumps(memory.to_dict()))
+    assert test_report.read_report_stream(str(path)) == expected
+    assert streamed.to_dict() == expected
+    assert expected["status"] == "ERROR"
+
+
+def test_nested_group_counts_toward_streamed_status(test_report, tmp_path):
+    report = test_report.TestReport("case", stream_path=str(tmp_path / "case.jsonl"))
+    with report.start_group("outer"):
+        with report.start_group("inner"):
+            report.add_step("FAIL", "inner fail")
+            assert report.status == "FAIL"
+    report.close()
+
+
+def test_aborted_stream_with_torn_last_line(test_report, tmp_path):
+    path = tmp_path / "case.jsonl"
+    report = test_report.TestReport("case", stream_path=str(path))
+    report.add_step("PASS", "first")
+    with report.start_group("done"):
+        report.add_step("FAIL", "inside")
+    report.add_step("ERROR", "last")
+    report._stream.close()  # the run dies before close(); no end record
+    text = path.read_text(encoding="utf-8")
+    path.write_text(text[:-10], encoding="utf-8")  # and the last record is cut short
+
+    res = test_report.read_report_stream(str(path))
+    assert res["name"] == "case"
+    assert [line["category"] for line in res["lines"]] == ["STEP", "GROUP"]
+    assert res["lines"][1]["status"] == "FAIL"
+    assert res["status"] == "FAIL"
+    assert res["index"] is None
@@ -2,5 +2,6 @@ from .test_report import (
     get_group_status,
     get_table_status,
     TestReport,
+    read_report_stream,
     _normalize_chart_input,  # optional re-export
 )